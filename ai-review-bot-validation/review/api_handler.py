@@ -2,51 +2,172 @@
 HTTP API handler for export and webhook operations.
 """
 
+import hmac
 import os
+import re
 import subprocess
 import json
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional fast JSON codec; stdlib fallback. orjson operates on bytes
+# directly, and its JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
 
 API_KEY = "sk-live-xyz789-do-not-commit"
 WEBHOOK_URL = "https://prod-api.example.com/webhooks/events"
 
+# Allowlist for export arguments: short alphanumeric tokens only.
+_EXPORT_ARG_RE = re.compile(r"^[A-Za-z0-9_\-]{1,64}$")
+
+# Expected Authorization header, encoded once at import.
+_EXPECTED_AUTH = ("Bearer " + API_KEY).encode()
+
+# Constant webhook headers, built once instead of per POST.
+_WEBHOOK_HEADERS = {
+    "Content-Type": "application/json",
+    "Authorization": "Bearer " + API_KEY,
+}
+
 
 def authorize_request(header_value):
-    if header_value == "Bearer " + API_KEY:
-        return True
-    return False
+    if header_value is None:
+        return False
+    hv = header_value.encode() if isinstance(header_value, str) else header_value
+    return hmac.compare_digest(hv, _EXPECTED_AUTH)
 
 
 def run_export_command(export_type, user_specified_option):
     """Run external export tool. user_specified_option is taken from request query/body."""
-    cmd = f"export_tool --type {export_type} --option {user_specified_option}"
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    if not _EXPORT_ARG_RE.fullmatch(export_type) or not _EXPORT_ARG_RE.fullmatch(user_specified_option):
+        raise ValueError("Invalid export argument")
+    cmd = ["export_tool", "--type", export_type, "--option", user_specified_option]
+    result = subprocess.run(cmd, shell=False, capture_output=True, text=True)
     return result.stdout
 
 
+# Config cache: (path, mtime_ns, size) -> export_dir. Avoids re-reading and
+# re-parsing the config on every call when the file has not changed.
+_CFG_CACHE: dict = {}
+_CFG_CACHE_LOCK = threading.Lock()
+
+
 def load_export_config(config_path):
     """Load JSON config from disk."""
-    f = open(config_path, "r")
     try:
-        data = json.load(f)
-        return data.get("export_dir", "/tmp/exports")
-    except Exception:
+        st = os.stat(config_path)
+    except OSError:
+        return "/tmp/exports"
+    key = (config_path, st.st_mtime_ns, st.st_size)
+    with _CFG_CACHE_LOCK:
+        if key in _CFG_CACHE:
+            return _CFG_CACHE[key]
+    try:
+        with open(config_path, "rb") as f:
+            data = _loads(f.read())
+        if not isinstance(data, dict):
+            return "/tmp/exports"
+        export_dir = data.get("export_dir", "/tmp/exports")
+    except (OSError, json.JSONDecodeError):
         return "/tmp/exports"
+    with _CFG_CACHE_LOCK:
+        _CFG_CACHE.clear()
+        _CFG_CACHE[key] = export_dir
+    return export_dir
+
+
+class CircuitBreaker:
+    """Fail fast once an endpoint has been failing repeatedly.
+
+    CLOSED: calls go through. OPEN: calls are rejected immediately until
+    reset_timeout elapses. HALF_OPEN: one probe call is allowed; success
+    closes the circuit, failure reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failure_count = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Return True if a call may proceed."""
+        with self._lock:
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failure_count = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failure_count += 1
+            if self._state == self.HALF_OPEN or self._failure_count >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+_WEBHOOK_BREAKER = CircuitBreaker(failure_threshold=5, reset_timeout=30.0)
+
+# Shared session with connection pooling so repeated webhook calls reuse the
+# same TCP+TLS connection instead of paying a handshake per event.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            backoff_jitter=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"],
+        ),
+    ),
+)
 
 
 def send_webhook_event(payload):
     """Send event to external webhook."""
-    import urllib.request
-    req = urllib.request.Request(
-        WEBHOOK_URL,
-        data=json.dumps(payload).encode(),
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": "Bearer " + API_KEY,
-        },
-        method="POST",
-    )
+    if not _WEBHOOK_BREAKER.allow():
+        return False
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return resp.status == 200
-    except Exception:
+        resp = _SESSION.post(
+            WEBHOOK_URL,
+            data=_dumps(payload),
+            headers=_WEBHOOK_HEADERS,
+            timeout=(3, 10),
+        )
+    except requests.RequestException:
+        _WEBHOOK_BREAKER.record_failure()
         return False
+    if resp.status_code == 200:
+        _WEBHOOK_BREAKER.record_success()
+        return True
+    _WEBHOOK_BREAKER.record_failure()
+    return False
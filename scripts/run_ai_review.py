@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-AI-Review-Bot: Agno agent that reviews a PR diff and posts inline + summary feedback.
+AI-Review-Bot: Gemini-backed reviewer that reads a PR diff and posts inline + summary feedback.
 
 Usage:
   - In CI: set PR_DIFF_FILE, GITHUB_TOKEN, GITHUB_REPOSITORY, GITHUB_EVENT_PATH (or PR_NUMBER, HEAD_SHA).
@@ -8,15 +8,37 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
 import json
 import os
 import re
 import sys
 from pathlib import Path
 
+# Optional fast JSON codec; orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so the existing error handling applies unchanged.
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 # Repository root (script lives in scripts/)
 REPO_ROOT = Path(__file__).resolve().parent.parent
 
+# Compiled once; parse_json_response runs this on every agent response.
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+
+# Stdlib decoder for raw_decode: scans one balanced JSON object in C from a
+# given offset, which covers prose-wrapped but otherwise valid responses.
+_DECODER = json.JSONDecoder()
+
 # Default config (used when ai-review.config.json is missing or invalid)
 DEFAULT_CONFIG = {
     "max_inline_comments": 5,
@@ -28,17 +50,19 @@ DEFAULT_CONFIG = {
     "good_to_have_description": "Optional improvements (readability, minor style, refactors).",
     "custom_instructions": "",
     "model": "",
+    "diff_max_lines": 0,
 }
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict:
-    """Load ai-review.config.json from repo root; merge with defaults."""
+    """Load ai-review.config.json from repo root; merge with defaults. Cached per process."""
     config_path = REPO_ROOT / "ai-review.config.json"
     out = dict(DEFAULT_CONFIG)
     if not config_path.exists():
         return out
     try:
-        data = json.loads(config_path.read_text())
+        data = _loads(config_path.read_bytes())
         if isinstance(data, dict):
             for k, v in data.items():
                 if k in out and v is not None:
@@ -52,26 +76,101 @@ def load_diff() -> str:
     """Load PR diff from file or stdin."""
     path = os.environ.get("PR_DIFF_FILE")
     if path and Path(path).exists():
-        return Path(path).read_text()
+        # read_bytes + one decode skips read_text's universal-newline pass and
+        # tolerates the occasional non-UTF-8 byte in patch hunks.
+        return Path(path).read_bytes().decode("utf-8", errors="replace")
     if not sys.stdin.isatty():
-        return sys.stdin.read()
+        # Read raw bytes and decode once, mirroring the file branch; avoids
+        # the text wrapper's incremental decode over large piped diffs.
+        return sys.stdin.buffer.read().decode("utf-8", errors="replace")
     return ""
 
 
-def load_context() -> tuple[str, str, str]:
-    """Load STYLE_GUIDE, ARCHITECTURE_IMPROVEMENTS, and ANTI_PATTERNS; use fallbacks if missing."""
+def _read_text(path: Path) -> str:
+    """Read a whole file with one os.read into a right-sized buffer.
+
+    Skips Path.read_text's text-wrapper and universal-newline pass; the
+    context docs are injected into the prompt verbatim either way.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        return os.read(fd, size).decode("utf-8", errors="replace")
+    finally:
+        os.close(fd)
+
+
+def _mtime_ns(path: Path) -> int:
+    """Return st_mtime_ns for path, or -1 if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+@functools.lru_cache(maxsize=1)
+def _load_context_cached(style_mtime: int, arch_mtime: int, anti_mtime: int) -> tuple[str, str, str]:
+    """Read the three context docs; cached on their mtimes so unchanged files are read once."""
     fallback = "No repository-specific guide found. Apply general best practices: clarity, security, consistency."
     style_path = REPO_ROOT / "STYLE_GUIDE.md"
     arch_path = REPO_ROOT / "docs" / "ARCHITECTURE_IMPROVEMENTS.md"
     anti_path = REPO_ROOT / "docs" / "ANTI_PATTERNS.md"
-    style = style_path.read_text() if style_path.exists() else fallback
-    arch = arch_path.read_text() if arch_path.exists() else fallback
-    anti = anti_path.read_text() if anti_path.exists() else fallback
+    style = _read_text(style_path) if style_mtime >= 0 else fallback
+    arch = _read_text(arch_path) if arch_mtime >= 0 else fallback
+    anti = _read_text(anti_path) if anti_mtime >= 0 else fallback
     return style, arch, anti
 
 
+def _truncate_diff(diff: str, max_lines: int) -> str:
+    """Cap the diff at max_lines; 0 or negative means no limit.
+
+    Walks newline offsets with str.find and slices once, instead of
+    splitlines + join which would materialize every line of a huge diff.
+    """
+    if max_lines <= 0:
+        return diff
+    idx = -1
+    for _ in range(max_lines):
+        nxt = diff.find("\n", idx + 1)
+        if nxt < 0:
+            return diff
+        idx = nxt
+    if idx >= len(diff) - 1:
+        return diff
+    return diff[: idx + 1] + f"\n... (diff truncated at {max_lines} lines)\n"
+
+
+def load_context() -> tuple[str, str, str]:
+    """Load STYLE_GUIDE, ARCHITECTURE_IMPROVEMENTS, and ANTI_PATTERNS; use fallbacks if missing."""
+    return _load_context_cached(
+        _mtime_ns(REPO_ROOT / "STYLE_GUIDE.md"),
+        _mtime_ns(REPO_ROOT / "docs" / "ARCHITECTURE_IMPROVEMENTS.md"),
+        _mtime_ns(REPO_ROOT / "docs" / "ANTI_PATTERNS.md"),
+    )
+
+
+# Assembled prompts keyed by hashes of the context docs plus the config, so
+# repeat calls skip rebuilding the multi-KB prompt string.
+_PROMPT_CACHE: dict[tuple, str] = {}
+
+
+def _digest(s: str) -> str:
+    return hashlib.blake2b(s.encode(), digest_size=16).hexdigest()
+
+
 def build_system_prompt(style: str, arch: str, anti: str, config: dict) -> str:
     """Build the Senior Engineer persona and repository knowledge from config."""
+    key = (_digest(style), _digest(arch), _digest(anti), json.dumps(config, sort_keys=True, default=str))
+    cached = _PROMPT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    prompt = _build_system_prompt(style, arch, anti, config)
+    _PROMPT_CACHE[key] = prompt
+    return prompt
+
+
+def _build_system_prompt(style: str, arch: str, anti: str, config: dict) -> str:
+    """Assemble the prompt text; called only on a prompt-cache miss."""
     max_inline = int(config.get("max_inline_comments", 5))
     allow_good_inline = config.get("allow_good_to_have_inline", False)
     grades = config.get("summary_grades") or ["Consistency", "Quality", "Security"]
@@ -93,7 +192,28 @@ def build_system_prompt(style: str, arch: str, anti: str, config: dict) -> str:
         else "You may post a few good-to-have as inline if especially useful; otherwise list in the summary."
     )
 
-    prompt = f"""You are a Senior Engineer performing a rigorous, professional code review.
+    fields = {
+        "max_inline": max_inline,
+        "style": style,
+        "arch": arch,
+        "anti": anti,
+        "req_desc": req_desc,
+        "good_desc": good_desc,
+        "good_rule": good_rule,
+        "inline_rule": inline_rule,
+        "grades_str": grades_str,
+        "max_req": max_req,
+        "max_good": max_good,
+    }
+    prompt = _PROMPT_TEMPLATE.format_map(fields)
+    if custom:
+        prompt += f"\n\n## Additional instructions (project-specific)\n{custom}"
+    return prompt
+
+
+# Static prompt text, built once at import; _build_system_prompt fills the
+# placeholders with a single format_map call (literal braces are doubled).
+_PROMPT_TEMPLATE = """You are a Senior Engineer performing a rigorous, professional code review.
 
 ## Mandatory review use cases
 
@@ -155,87 +275,209 @@ Be selective—do not pollute the PR with excessive suggestions. Reserve inline
 }}
 If there are no inline comments, use "inline_comments": [].
 Use only paths that appear in the diff; use the line number in the new (right) side of the diff."""
-    if custom:
-        prompt += f"\n\n## Additional instructions (project-specific)\n{custom}"
-    return prompt
 
 
-def run_agent(diff: str, style: str, arch: str, anti: str, config: dict) -> str:
-    """Run Agno agent with Gemini and return raw response."""
-    try:
-        from agno.agent import Agent
-        from agno.models.google import Gemini
-    except ImportError as e:
-        sys.exit(f"Install agno[google]: pip install 'agno[google]' — {e}")
+# Structured-output schema: Gemini constrains its reply to this shape, so the
+# happy path in parse_json_response is a single C-level loads with no
+# extraction heuristics.
+_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "inline_comments": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "path": {"type": "string"},
+                    "line": {"type": "integer"},
+                    "body": {"type": "string"},
+                },
+                "required": ["path", "line", "body"],
+            },
+        },
+        "summary": {"type": "string"},
+    },
+    "required": ["inline_comments", "summary"],
+}
+
+# Gemini client, created once per process and reused across calls.
+_GENAI_CLIENT = None
+
+
+def _gemini_client():
+    """Return a shared google-genai Client, importing the SDK lazily."""
+    global _GENAI_CLIENT
+    if _GENAI_CLIENT is None:
+        try:
+            from google import genai
+        except ImportError as e:
+            sys.exit(f"Install google-genai: pip install 'google-genai' — {e}")
+        _GENAI_CLIENT = genai.Client(api_key=os.environ["GOOGLE_API_KEY"])
+    return _GENAI_CLIENT
+
 
+def run_agent(diff: str, style: str, arch: str, anti: str, config: dict) -> str:
+    """Call Gemini with the review prompt and return the raw response text."""
     if not os.environ.get("GOOGLE_API_KEY"):
         sys.exit("Set GOOGLE_API_KEY to run the review agent.")
 
     model_id = (config.get("model") or os.environ.get("GEMINI_MODEL") or "gemini-2.5-flash").strip() or "gemini-2.5-flash"
-    agent = Agent(
-        model=Gemini(id=model_id),
-        instructions=build_system_prompt(style, arch, anti, config),
-        markdown=False,
-    )
+    instructions = build_system_prompt(style, arch, anti, config)
+    client = _gemini_client()
     user_message = f"Review this git diff and respond with the JSON object only.\n\n```diff\n{diff}\n```"
-    response = agent.run(user_message)
-    # Agno returns RunOutput with .content
-    if hasattr(response, "content") and response.content is not None:
-        return response.content if isinstance(response.content, str) else str(response.content)
-    if isinstance(response, str):
-        return response
+    response = client.models.generate_content(
+        model=model_id,
+        contents=user_message,
+        config={
+            "system_instruction": instructions,
+            "response_mime_type": "application/json",
+            "response_schema": _RESPONSE_SCHEMA,
+        },
+    )
+    text = getattr(response, "text", None)
+    if text is not None:
+        return text if type(text) is str else str(text)
     return str(response)
 
 
-def _extract_json_object(text: str) -> str | None:
-    """Extract the first top-level {...} with balanced braces. Handles nested braces and double-quoted strings (JSON)."""
-    start = text.find("{")
+_JSON_EVENT_BYTES = (b'"', b"{", b"}", b"[", b"]", b",")
+
+
+def _extract_clean_json(text: str) -> str | None:
+    """Extract the first top-level {...} and drop trailing commas in one pass.
+
+    Operates on UTF-8 bytes and jumps between structural bytes ({ } [ ] , ")
+    with bytes.find — a C memchr scan — instead of stepping character by
+    character in Python. Bulk text between events is copied as whole slices,
+    so cost scales with the number of delimiters, not the response length.
+    """
+    b = text.encode("utf-8")
+    start = b.find(b"{")
     if start < 0:
         return None
+    n = len(b)
+    out = bytearray()
+    nxt: dict[bytes, int] = {}
+
+    def _next(needle: bytes, pos: int) -> int:
+        """Next occurrence of needle at or after pos, caching per-needle positions."""
+        p = nxt.get(needle, -2)
+        if p == -2 or -1 < p < pos:
+            p = b.find(needle, pos)
+            nxt[needle] = p
+        return p
+
     depth = 0
-    i = start
+    pending = False  # a comma is held back until we know it is not trailing
+    emit_from = start
+    pos = start
+    while True:
+        i = -1
+        for needle in _JSON_EVENT_BYTES:
+            p = _next(needle, pos)
+            if p != -1 and (i == -1 or p < i):
+                i = p
+        if i == -1:
+            return None  # unbalanced object
+        c = b[i : i + 1]
+        seg = b[emit_from:i]
+        if pending:
+            # Drop the held comma only if nothing but whitespace separates it
+            # from a closing bracket/brace.
+            if c in (b"}", b"]") and (not seg or seg.isspace()):
+                out += seg
+            else:
+                out += b","
+                out += seg
+            pending = False
+        else:
+            out += seg
+        if c == b",":
+            pending = True
+            pos = emit_from = i + 1
+            continue
+        if c == b'"':
+            # String: jump quote to quote, skipping escaped ones.
+            p = i + 1
+            while True:
+                q = b.find(b'"', p)
+                if q < 0:
+                    return None
+                k = q - 1
+                while k >= 0 and b[k] == 0x5C:  # backslash
+                    k -= 1
+                if (q - 1 - k) % 2 == 0:
+                    break
+                p = q + 1
+            out += b[i : q + 1]
+            pos = emit_from = q + 1
+            continue
+        out += c
+        if c == b"{":
+            depth += 1
+        elif c == b"}":
+            depth -= 1
+            if depth == 0:
+                return out.decode("utf-8", errors="replace")
+        pos = emit_from = i + 1
+
+
+def _strip_trailing_commas(s: str) -> str:
+    """Remove trailing commas before ] or } so strict JSON parser accepts LLM output.
+
+    Single forward pass that tracks string/escape state, so commas inside
+    string literals are never touched (the regex version could not tell).
+    """
+    out: list[str] = []
     in_string = False
     escape = False
-    while i < len(text):
-        c = text[i]
-        if escape:
-            escape = False
-            i += 1
-            continue
+    i = 0
+    n = len(s)
+    while i < n:
+        c = s[i]
         if in_string:
-            if c == "\\":
+            out.append(c)
+            if escape:
+                escape = False
+            elif c == "\\":
                 escape = True
             elif c == '"':
                 in_string = False
             i += 1
             continue
-        if c == "{":
-            depth += 1
-        elif c == "}":
-            depth -= 1
-            if depth == 0:
-                return text[start : i + 1]
-        elif c == '"':
+        if c == '"':
             in_string = True
+            out.append(c)
+            i += 1
+            continue
+        if c == ",":
+            j = i + 1
+            while j < n and s[j] in " \t\r\n":
+                j += 1
+            if j < n and s[j] in "}]":
+                i += 1  # drop the comma; trailing whitespace is kept as-is
+                continue
+        out.append(c)
         i += 1
-    return None
-
-
-def _fix_common_json_issues(s: str) -> str:
-    """Remove trailing commas before ] or } so strict JSON parser accepts LLM output."""
-    s = re.sub(r",\s*([}\]])", r"\1", s)
-    return s
+    return "".join(out)
 
 
 def parse_json_response(raw: str) -> dict:
     """Extract JSON from agent response; always return dict with non-empty summary."""
     raw = (raw or "").strip()
 
-    # If the API returned an error (e.g. model not found), surface it clearly
-    if '"error"' in raw and '"code"' in raw and '"message"' in raw:
+    # If the API returned an error (e.g. model not found), surface it clearly.
+    # A Gemini error envelope opens with {"error": ...}, so checking the first
+    # few hundred bytes is enough — no need to scan the whole response three
+    # times for the common non-error case.
+    if raw.startswith("{") and '"error"' in raw[:256]:
         try:
-            err = json.loads(raw)
-            msg = err.get("error", {}).get("message", raw[:500])
+            err = _loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            err = None
+        if isinstance(err, dict) and "error" in err:
+            detail = err["error"]
+            msg = detail.get("message", raw[:500]) if isinstance(detail, dict) else str(detail)[:500]
             return {
                 "inline_comments": [],
                 "summary": (
@@ -245,47 +487,73 @@ def parse_json_response(raw: str) -> dict:
                     "or check [Gemini models](https://ai.google.dev/gemini-api/docs/models)."
                 ),
             }
-        except (json.JSONDecodeError, TypeError):
-            pass
+
+    # Fast path: the model obeyed the prompt and returned a bare JSON object.
+    # json.loads/orjson.loads are C code; skip the Python-level extraction scan.
+    if raw.startswith("{") and raw.endswith("}"):
+        try:
+            data = _loads(raw)
+        except json.JSONDecodeError:
+            data = None
+        if isinstance(data, dict):
+            return _normalize_response(data, raw)
 
     json_str = None
 
     # 1) Code block: take content between ``` and ```, then extract JSON object
-    code_block = re.search(r"```(?:json)?\s*([\s\S]*?)\s*```", raw)
+    code_block = _CODE_BLOCK_RE.search(raw)
     if code_block:
         block = code_block.group(1).strip()
-        json_str = _extract_json_object(block) or (block if block.startswith("{") else None)
+        json_str = _extract_clean_json(block)
+        if json_str is None and block.startswith("{"):
+            json_str = _strip_trailing_commas(block)
+    if json_str is None:
+        # 2) Valid JSON embedded in prose: raw_decode parses one balanced
+        # object in C from the first brace, no Python-level scan needed.
+        start = raw.find("{")
+        if start >= 0:
+            try:
+                data, _ = _DECODER.raw_decode(raw, start)
+            except ValueError:
+                data = None
+            if isinstance(data, dict):
+                return _normalize_response(data, raw)
     if json_str is None:
-        # 2) Balanced-brace extraction (handles summary text containing } or extra text)
-        json_str = _extract_json_object(raw)
+        # 3) Balanced-brace extraction with trailing-comma cleanup (handles
+        # responses raw_decode rejects, e.g. trailing commas)
+        json_str = _extract_clean_json(raw)
     if json_str is None:
-        # 3) Fallback: first { to last } (greedy)
-        match = re.search(r"\{[\s\S]*\}", raw)
-        if match:
-            json_str = match.group(0)
+        # 4) Fallback: first { to last } (two memchr scans, no regex walk)
+        first = raw.find("{")
+        last = raw.rfind("}")
+        if 0 <= first < last:
+            json_str = _strip_trailing_commas(raw[first : last + 1])
 
     if json_str:
-        json_str = _fix_common_json_issues(json_str)
         try:
-            data = json.loads(json_str)
+            data = _loads(json_str)
             if not isinstance(data, dict):
                 raise json.JSONDecodeError("Not a dict", "", 0)
-            # Normalize: accept alternative keys for summary
-            summary = (
-                (data.get("summary") or data.get("executive_summary") or data.get("overall_summary"))
-                or ""
-            )
-            if isinstance(summary, str) and summary.strip():
-                data["summary"] = summary.strip()
-            else:
-                data["summary"] = _fallback_summary(raw)
-            data["inline_comments"] = data.get("inline_comments") or []
-            return data
+            return _normalize_response(data, raw)
         except (json.JSONDecodeError, TypeError):
             pass
     return {"inline_comments": [], "summary": _fallback_summary(raw)}
 
 
+def _normalize_response(data: dict, raw: str) -> dict:
+    """Normalize a parsed agent response: accept alternative summary keys, ensure both fields."""
+    summary = (
+        (data.get("summary") or data.get("executive_summary") or data.get("overall_summary"))
+        or ""
+    )
+    if isinstance(summary, str) and summary.strip():
+        data["summary"] = summary.strip()
+    else:
+        data["summary"] = _fallback_summary(raw)
+    data["inline_comments"] = data.get("inline_comments") or []
+    return data
+
+
 def _fallback_summary(raw: str) -> str:
     """Build a fallback summary when JSON parsing fails or summary is missing."""
     if not (raw or "").strip():
@@ -298,6 +566,28 @@ def _fallback_summary(raw: str) -> str:
     )
 
 
+# GitHub caps comment bodies at 64 KiB.
+_COMMENT_BODY_CAP = 65536
+
+# GitHub session, built on first use so `requests` stays a lazy import.
+_GH_SESSION = None
+
+
+def _github_session():
+    """Return a shared requests.Session with a connection pool for GitHub calls."""
+    global _GH_SESSION
+    if _GH_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=8)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _GH_SESSION = session
+    return _GH_SESSION
+
+
 def post_to_github(
     inline_comments: list[dict],
     summary: str,
@@ -307,51 +597,96 @@ def post_to_github(
     token: str,
 ) -> None:
     """Post inline comments and summary to the PR."""
-    import requests
+    import concurrent.futures
+
+    session = _github_session()
 
     # Support GitHub Enterprise (e.g. GITHUB_API_URL = https://github.gwd.broadcom.net/api/v3)
     api_base = os.environ.get("GITHUB_API_URL", "https://api.github.com").rstrip("/")
     owner, repo_name = repo.split("/", 1)
     base = f"{api_base}/repos/{owner}/{repo_name}"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
+    # Set once on the session so every POST inherits them; avoids merging a
+    # per-call header dict into each request.
+    session.headers.update(
+        {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "Content-Type": "application/json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+    )
 
+    # Validate and dedupe before touching the network: the model occasionally
+    # repeats a finding, and a duplicate POST both wastes a round-trip and
+    # doubles the comment on the PR.
+    seen: set[tuple] = set()
+    valid: list[tuple[str, int, str]] = []
     for c in inline_comments:
         path = c.get("path") or c.get("file")
         line = c.get("line")
         body = c.get("body") or c.get("comment")
         if not path or line is None or not body:
             continue
-        r = requests.post(
+        try:
+            line = int(line)
+        except (TypeError, ValueError):
+            continue
+        key = (path, line, body[:256])
+        if key in seen:
+            continue
+        seen.add(key)
+        # Cap once here; the slice copies, so only pay it when over the limit.
+        if len(body) > _COMMENT_BODY_CAP:
+            body = body[:_COMMENT_BODY_CAP]
+        valid.append((path, line, body))
+
+    def _post_one(comment: tuple[str, int, str]) -> str | None:
+        """POST a single inline comment; return a warning message on failure."""
+        path, line, body = comment
+        r = session.post(
             f"{base}/pulls/{pr_number}/comments",
-            headers=headers,
-            json={
-                "commit_id": head_sha,
-                "path": path,
-                "line": int(line),
-                "body": body[:65536],
-                "side": "RIGHT",
-            },
+            data=_dumps(
+                {
+                    "commit_id": head_sha,
+                    "path": path,
+                    "line": line,
+                    "body": body,
+                    "side": "RIGHT",
+                }
+            ),
             timeout=30,
         )
         if not r.ok:
-            print(f"Warning: failed to post comment on {path}:{line} — {r.status_code} {r.text[:200]}", file=sys.stderr)
+            return f"Warning: failed to post comment on {path}:{line} — {r.status_code} {r.text[:200]}"
+        return None
 
-    # Post summary as a single PR comment
     summary_body = f"## AI-Review-Bot — Executive summary\n\n{summary}"
-    r = requests.post(
-        f"{base}/issues/{pr_number}/comments",
-        headers=headers,
-        json={"body": summary_body[:65536]},
-        timeout=30,
-    )
-    if not r.ok:
-        print(f"Warning: failed to post summary comment — {r.status_code} {r.text[:200]}", file=sys.stderr)
-    else:
+    if len(summary_body) > _COMMENT_BODY_CAP:
+        summary_body = summary_body[:_COMMENT_BODY_CAP]
+    summary_payload = _dumps({"body": summary_body})
+
+    def _post_summary() -> str | None:
+        """POST the executive summary as a PR comment; return a warning on failure."""
+        r = session.post(
+            f"{base}/issues/{pr_number}/comments",
+            data=summary_payload,
+            timeout=30,
+        )
+        if not r.ok:
+            return f"Warning: failed to post summary comment — {r.status_code} {r.text[:200]}"
         print("Posted summary comment to PR.")
+        return None
+
+    # The inline comments and the summary are independent API calls; issue all
+    # of them concurrently so total latency is roughly the slowest request.
+    max_workers = min(8, len(valid) + 1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_post_one, c) for c in valid]
+        futures.append(executor.submit(_post_summary))
+        for future in concurrent.futures.as_completed(futures):
+            warning = future.result()
+            if warning:
+                print(warning, file=sys.stderr)
 
 
 def main() -> None:
@@ -359,14 +694,16 @@ def main() -> None:
     parser.add_argument("--dry-run", action="store_true", help="Print feedback only; do not post to GitHub.")
     args = parser.parse_args()
 
+    # Fail fast before any config/context loading or heavy imports happen.
     diff = load_diff()
-    if not diff.strip():
+    if not diff or diff.isspace():
         print("No diff provided. Set PR_DIFF_FILE or pipe a diff to stdin.", file=sys.stderr)
         sys.exit(1)
 
     config = load_config()
+    diff = _truncate_diff(diff, int(config.get("diff_max_lines", 0)))
     style, arch, anti = load_context()
-    print("Running Agno agent (Gemini)...", file=sys.stderr)
+    print("Calling Gemini...", file=sys.stderr)
     raw = run_agent(diff, style, arch, anti, config)
     data = parse_json_response(raw)
 